@@ -1,27 +1,66 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, Tuple
-from datetime import datetime, timedelta
+import re
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+
+# Optionally signed decimal number with optional exponent, e.g. '80', '-5',
+# '99.5', '.5', '5.' or '1e2'
+_FLOAT_RE = re.compile(
+  r'^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*$'
+)
+
+
+def _parse_percentage(value: str) -> Optional[float]:
+  """Parse a percentage entry without raising.
+
+  Accepts signed decimals with an optional exponent, as float() does, but
+  not 'inf', 'nan' or digit underscores. Blank or non-numeric text reads
+  as 0, matching an empty entry.
+
+  Args:
+    value: String value to parse
+
+  Returns:
+    Float value, or None if it is outside 0-100
+  """
+  match = _FLOAT_RE.match(value)
+  percentage = float(match.group(1)) if match else 0.0
+  return percentage if 0 <= percentage <= 100 else None
 
 
 class NissanLeafCharger:
   """Core calculator class for Nissan Leaf charging times.
 
   Attributes:
+    CHARGING_LEVELS: Tuple of (label, rate in kW) pairs, in display order
     CHARGING_RATES: Dict of charging rates in kW for different charging levels
+    BATTERY_OPTIONS: Tuple of (label, capacity in kWh) pairs, in display order
     BATTERY_CAPACITIES: Dict of available battery capacities in kWh
   """
 
-  CHARGING_RATES = {
-    'Level 1 (120V)': 1.4,
-    'Level 2 (240V) 3.3kW': 3.3,
-    'Level 2 (240V) 6.6kW': 6.6
-  }
-
-  BATTERY_CAPACITIES = {
-    '40 kWh': 40,
-    '62 kWh': 62
-  }
+  __slots__ = (
+    '_battery_capacity',
+    '_kernel',
+    'battery_health',
+    'current_charge',
+    '_charging_rate',
+    '_inv_rate'
+  )
+
+  CHARGING_LEVELS = (
+    ('Level 1 (120V)', 1.4),
+    ('Level 2 (240V) 3.3kW', 3.3),
+    ('Level 2 (240V) 6.6kW', 6.6)
+  )
+  CHARGING_RATES = dict(CHARGING_LEVELS)
+
+  BATTERY_OPTIONS = (
+    ('40 kWh', 40),
+    ('62 kWh', 62)
+  )
+  BATTERY_CAPACITIES = dict(BATTERY_OPTIONS)
 
   def __init__(self):
     """Initialize the charger calculator with default values."""
@@ -30,6 +69,64 @@ class NissanLeafCharger:
     self.current_charge = 0     # Default to 0%
     self.charging_rate = 6.6    # Default to 6.6kW
 
+  @property
+  def battery_capacity(self) -> float:
+    """Battery capacity in kWh."""
+    return self._battery_capacity
+
+  @battery_capacity.setter
+  def battery_capacity(self, capacity: float):
+    self._battery_capacity = capacity
+    self._kernel = self.make_specialized(capacity)
+
+  @property
+  def charging_rate(self) -> float:
+    """Charging rate in kW."""
+    return self._charging_rate
+
+  @charging_rate.setter
+  def charging_rate(self, rate: float):
+    # Fold the 10% charging inefficiency into a precomputed inverse rate
+    # so each calculation needs a single multiply instead of a divide.
+    self._charging_rate = rate
+    self._inv_rate = 1.1 / rate if rate > 0 else float('inf')
+
+  @staticmethod
+  @lru_cache(maxsize=None)
+  def make_specialized(
+      capacity: float
+  ) -> Callable[[float, float, Tuple[float, ...], float], Tuple[float, ...]]:
+    """Build a charging-time kernel with the battery capacity baked in.
+
+    Kernels are memoized per capacity, so each is built once and the same
+    function object can be used as a cache key.
+
+    Args:
+      capacity: Battery capacity in kWh
+
+    Returns:
+      Pure-float function (health, current, targets, inv_rate) -> hours
+      for each target, in order
+    """
+    # Both percentages are scaled by 1/100, hence the single 1e-4 factor
+    scale = capacity * 1e-4
+
+    def charging_hours(
+        health: float,
+        current: float,
+        targets: Tuple[float, ...],
+        inv_rate: float
+    ) -> Tuple[float, ...]:
+      # Everything but the target is shared, so each target costs one
+      # subtract and one multiply
+      k = scale * health * inv_rate
+      return tuple(
+        k * (target - current) if target > current else 0.0
+        for target in targets
+      )
+
+    return charging_hours
+
   def calculate_charging_time(self, target_percentage: float) -> float:
     """Calculate time needed to reach target charge level.
 
@@ -40,26 +137,93 @@ class NissanLeafCharger:
       Float representing hours needed to reach target charge
 
     Raises:
-      ValueError: If target_percentage is not between 0 and 100
+      ValueError: If any percentage is not between 0 and 100
     """
-    if not (0 <= target_percentage <= 100):
-      raise ValueError('Target percentage must be between 0 and 100')
+    return self.calculate_charging_times((target_percentage,))[
+      target_percentage
+    ]
 
-    actual_capacity = self.battery_capacity * (self.battery_health / 100)
-    current_energy = actual_capacity * (self.current_charge / 100)
-    target_energy = actual_capacity * (target_percentage / 100)
-    energy_needed = target_energy - current_energy
+  def calculate_charging_times(
+      self, targets: Tuple[float, ...] = (80, 100)
+  ) -> Mapping[float, float]:
+    """Calculate time needed to reach each of several target charge levels.
 
-    if self.charging_rate <= 0:
-      return float('inf')
+    Inputs are validated once for all targets, and results are cached on
+    the rounded inputs so repeated calculations are not recomputed.
 
-    energy_needed *= 1.1  # Add 10% for charging inefficiency
-    return energy_needed / self.charging_rate
+    Args:
+      targets: Target charge percentages (0-100)
+
+    Returns:
+      Read-only mapping of each target percentage to the hours needed to
+      reach it; targets at or below the current charge map to 0
+
+    Raises:
+      ValueError: If any percentage is not between 0 and 100
+    """
+    if not (0 <= self.battery_health <= 100):
+      raise ValueError('Battery health must be between 0 and 100')
+    if not (0 <= self.current_charge <= 100):
+      raise ValueError('Current charge must be between 0 and 100')
+    for target in targets:
+      if not (0 <= target <= 100):
+        raise ValueError('Target percentage must be between 0 and 100')
+
+    return _charging_times(
+      self._kernel,
+      round(self.battery_health, 2),
+      round(self.current_charge, 2),
+      self._inv_rate,
+      tuple(targets)
+    )
+
+
+@lru_cache(maxsize=128)
+def _charging_times(
+    kernel: Callable[[float, float, Tuple[float, ...], float], Tuple[float, ...]],
+    health: float,
+    current: float,
+    inv_rate: float,
+    targets: Tuple[float, ...]
+) -> Mapping[float, float]:
+  """Compute charging hours for each target; cached on all arguments.
+
+  The result is shared between cache hits, so it is returned read-only.
+  """
+  if inv_rate == float('inf'):
+    return MappingProxyType(dict.fromkeys(targets, inv_rate))
+
+  return MappingProxyType(
+    dict(zip(targets, kernel(health, current, targets, inv_rate)))
+  )
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(hours_int: int, minutes: int) -> str:
+  """Format whole hours and minutes; cached so repeats reuse the string."""
+  if hours_int == 0:
+    return f'{minutes} minutes'
+  elif minutes == 0:
+    return f'{hours_int} hours'
+  else:
+    return f'{hours_int} hours {minutes} minutes'
+
+
+@lru_cache(maxsize=64)
+def _format_timestamp(seconds: int) -> str:
+  """Format epoch seconds as local time; cached per whole second."""
+  return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
 
 
 class NissanLeafGUI:
   """GUI class for the Nissan Leaf Charging Calculator."""
 
+  # Delay after the last keystroke before recalculating
+  DEBOUNCE_MS = 150
+
+  # Target charge percentages shown in the results grid
+  TARGETS = (80, 100)
+
   def __init__(self, root):
     """Initialize the GUI.
 
@@ -68,13 +232,19 @@ class NissanLeafGUI:
     """
     self.root = root
     self.charger = NissanLeafCharger()
-    self.start_time = datetime.now()
+    self._start_epoch = time.time()
+    self._pending = None
+    # Input fields changed since the charger was last synced; all of them
+    # start dirty so the first update loads every value
+    self._dirty = {'battery', 'charging', 'health', 'current'}
     self.setup_gui()
 
 
-  # In the NissanLeafGUI class, modify the setup_gui method:
   def setup_gui(self):
       """Set up the GUI elements."""
+      import tkinter as tk
+      from tkinter import ttk
+
       self.root.title('Nissan Leaf Charging Calculator')
       self.root.geometry('600x400')  # Reduced from 800x500
 
@@ -94,7 +264,7 @@ class NissanLeafGUI:
           row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5
       )
       self.time_frame.columnconfigure(0, weight=1)
-      start_time_str = self.start_time.strftime('%Y-%m-%d %H:%M:%S')
+      start_time_str = _format_timestamp(int(self._start_epoch))
       self.start_time_label = ttk.Label(self.time_frame, text=start_time_str)
       self.start_time_label.grid(row=0, column=0, sticky=tk.W)
 
@@ -111,11 +281,14 @@ class NissanLeafGUI:
       battery_combo = ttk.Combobox(
           input_frame,
           textvariable=self.battery_var,
-          values=list(NissanLeafCharger.BATTERY_CAPACITIES.keys()),
+          values=[name for name, _ in NissanLeafCharger.BATTERY_OPTIONS],
+          state='readonly',  # Only listed options; synced on selection
           width=30  # Set explicit width
       )
       battery_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5)
-      battery_combo.bind('<<ComboboxSelected>>', self.update_calculations)
+      battery_combo.bind(
+          '<<ComboboxSelected>>', lambda e: self._on_change('battery')
+      )
 
       # Charging Rate Selection
       ttk.Label(input_frame, text='Charging Rate:').grid(
@@ -125,29 +298,36 @@ class NissanLeafGUI:
       charging_combo = ttk.Combobox(
           input_frame,
           textvariable=self.charging_var,
-          values=list(NissanLeafCharger.CHARGING_RATES.keys()),
+          values=[name for name, _ in NissanLeafCharger.CHARGING_LEVELS],
+          state='readonly',  # Only listed options; synced on selection
           width=30  # Set explicit width
       )
       charging_combo.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5)
-      charging_combo.bind('<<ComboboxSelected>>', self.update_calculations)
+      charging_combo.bind(
+          '<<ComboboxSelected>>', lambda e: self._on_change('charging')
+      )
 
       # Battery Health
       ttk.Label(input_frame, text='Battery Health (%):').grid(
           row=2, column=0, sticky=tk.W, pady=5, padx=(0, 10)
       )
-      self.health_var = tk.StringVar(value='100')
-      health_entry = ttk.Entry(input_frame, textvariable=self.health_var, width=30)
-      health_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
-      health_entry.bind('<KeyRelease>', self.validate_and_update)
+      self.health_entry = ttk.Entry(input_frame, width=30)
+      self.health_entry.insert(0, '100')
+      self.health_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
+      self.health_entry.bind(
+          '<KeyRelease>', lambda e: self._on_change('health')
+      )
 
       # Current Charge
       ttk.Label(input_frame, text='Current Charge (%):').grid(
           row=3, column=0, sticky=tk.W, pady=5, padx=(0, 10)
       )
-      self.current_var = tk.StringVar(value='0')
-      current_entry = ttk.Entry(input_frame, textvariable=self.current_var, width=30)
-      current_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
-      current_entry.bind('<KeyRelease>', self.validate_and_update)
+      self.current_entry = ttk.Entry(input_frame, width=30)
+      self.current_entry.insert(0, '0')
+      self.current_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
+      self.current_entry.bind(
+          '<KeyRelease>', lambda e: self._on_change('current')
+      )
 
       # Results Frame
       results_frame = ttk.LabelFrame(
@@ -160,94 +340,95 @@ class NissanLeafGUI:
       results_frame.columnconfigure(2, weight=1)
 
       self._setup_results_grid(results_frame)
+
+      # Status line for input errors, shown inline instead of in a dialog
+      self.status_label = ttk.Label(main_frame, text='', foreground='red')
+      self.status_label.grid(row=3, column=0, columnspan=2, sticky=tk.W)
+
       self.update_calculations()
 
-  def _setup_results_grid(self, frame):
-      """Set up the results display grid.
-
-      Args:
-        frame: Frame to contain the results grid
-      """
-      # Column Headers with consistent spacing
-      headers = ['Target', 'Duration', 'Completion Time']
-      for col, header in enumerate(headers):
-          ttk.Label(frame, text=header).grid(
-              row=0, column=col, sticky=tk.W, padx=(5, 15)
-          )
-
-      # Results Labels for 80%
-      ttk.Label(frame, text='To 80% charge:').grid(
-          row=1, column=0, sticky=tk.W, pady=5, padx=(5, 15)
-      )
-      self.time_80_label = ttk.Label(frame, text='')
-      self.time_80_label.grid(row=1, column=1, sticky=tk.W, pady=5, padx=(5, 15))
-      self.completion_80_label = ttk.Label(frame, text='')
-      self.completion_80_label.grid(row=1, column=2, sticky=tk.W, pady=5, padx=5)
-
-      # Results Labels for 100%
-      ttk.Label(frame, text='To 100% charge:').grid(
-          row=2, column=0, sticky=tk.W, pady=5, padx=(5, 15)
-      )
-      self.time_100_label = ttk.Label(frame, text='')
-      self.time_100_label.grid(row=2, column=1, sticky=tk.W, pady=5, padx=(5, 15))
-      self.completion_100_label = ttk.Label(frame, text='')
-      self.completion_100_label.grid(row=2, column=2, sticky=tk.W, pady=5, padx=5)
   def _setup_results_grid(self, frame):
     """Set up the results display grid.
 
     Args:
       frame: Frame to contain the results grid
     """
+    import tkinter as tk
+    from tkinter import ttk
+
     # Column Headers
     headers = ['Target', 'Duration', 'Completion Time']
     for col, header in enumerate(headers):
       ttk.Label(frame, text=header).grid(row=0, column=col, sticky=tk.W, padx=5)
 
-    # Results Labels for 80%
-    ttk.Label(frame, text='To 80% charge:').grid(
-      row=1, column=0, sticky=tk.W, pady=5, padx=5
-    )
-    self.time_80_label = ttk.Label(frame, text='')
-    self.time_80_label.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
-    self.completion_80_label = ttk.Label(frame, text='')
-    self.completion_80_label.grid(row=1, column=2, sticky=tk.W, pady=5, padx=5)
-
-    # Results Labels for 100%
-    ttk.Label(frame, text='To 100% charge:').grid(
-      row=2, column=0, sticky=tk.W, pady=5, padx=5
-    )
-    self.time_100_label = ttk.Label(frame, text='')
-    self.time_100_label.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
-    self.completion_100_label = ttk.Label(frame, text='')
-    self.completion_100_label.grid(row=2, column=2, sticky=tk.W, pady=5, padx=5)
+    # One row of result labels per target, all gridded directly into frame
+    cell = {'sticky': tk.W, 'pady': 5, 'padx': 5}
+    self.time_labels = {}
+    self.completion_labels = {}
+    for row, target in enumerate(self.TARGETS, start=1):
+      ttk.Label(frame, text=f'To {target}% charge:').grid(
+        row=row, column=0, **cell
+      )
+      self.time_labels[target] = ttk.Label(frame, text='')
+      self.time_labels[target].grid(row=row, column=1, **cell)
+      self.completion_labels[target] = ttk.Label(frame, text='')
+      self.completion_labels[target].grid(row=row, column=2, **cell)
 
-  def validate_number(self, value: str) -> float:
-    """Validate and convert string input to float.
+  def _read_percentage(
+      self, entry, default: str, name: str, notices: List[str]
+  ) -> float:
+    """Read a percentage entry, resetting it to default if out of range.
 
     Args:
-      value: String value to validate
+      entry: Entry widget to read
+      default: Text to restore when the value is outside 0-100
+      name: Field name used in the reset notice
+      notices: List to append a notice to when the entry is reset
 
     Returns:
-      Float value, or 0.0 if invalid
+      Float value of the entry
     """
-    if not value.strip():
-      return 0.0
+    percentage = _parse_percentage(entry.get())
+    if percentage is None:
+      self._set_entry_text(entry, default)
+      notices.append(f'{name} must be between 0 and 100; reset to {default}')
+      percentage = _parse_percentage(default)
+    return percentage
 
-    try:
-      return float(value.strip())
-    except ValueError:
-      return 0.0
+  def _lookup_option(self, options: Dict[str, float], value: str, name: str):
+    """Look up a combobox selection in its options dict.
 
-  def validate_and_update(self, *args):
-    """Validate input before updating calculations."""
-    health = self.validate_number(self.health_var.get())
-    if health < 0 or health > 100:
-      self.health_var.set('100')
+    Args:
+      options: Dict mapping option labels to values
+      value: Selected or typed combobox text
+      name: Field name used in the error message
 
-    current = self.validate_number(self.current_var.get())
-    if current < 0 or current > 100:
-      self.current_var.set('0')
+    Returns:
+      Value for the selected option
+
+    Raises:
+      ValueError: If value is not one of the option labels
+    """
+    try:
+      return options[value]
+    except KeyError:
+      raise ValueError(f'Unknown {name}: {value!r}') from None
+
+  def _on_change(self, field: str):
+    """Mark an input field dirty and schedule a debounced update.
 
+    Args:
+      field: Name of the changed field ('battery', 'charging', 'health'
+        or 'current')
+    """
+    self._dirty.add(field)
+    if self._pending:
+      self.root.after_cancel(self._pending)
+    self._pending = self.root.after(self.DEBOUNCE_MS, self._do_update)
+
+  def _do_update(self):
+    """Run the debounced update scheduled by _on_change."""
+    self._pending = None
     self.update_calculations()
 
   def format_time(self, hours: float) -> str:
@@ -262,15 +443,12 @@ class NissanLeafGUI:
     if hours == float('inf'):
       return 'Invalid input'
 
-    hours_int = int(hours)
-    minutes = int((hours - hours_int) * 60)
+    # A target already reached needs no charging; clamping here also keeps
+    # divmod's floor from turning -0.5 hours into "-1 hours 30 minutes"
+    hours = max(hours, 0.0)
 
-    if hours_int == 0:
-      return f'{minutes} minutes'
-    elif minutes == 0:
-      return f'{hours_int} hours'
-    else:
-      return f'{hours_int} hours {minutes} minutes'
+    # Round to the nearest minute so e.g. 1.9999 hours reads as 2 hours
+    return _format_duration(*divmod(int(hours * 60 + 0.5), 60))
 
   def calculate_completion_time(self, hours: float) -> str:
     """Calculate and format the completion time.
@@ -284,49 +462,86 @@ class NissanLeafGUI:
     if hours == float('inf'):
       return 'Invalid input'
 
-    completion_time = self.start_time + timedelta(hours=hours)
-    return completion_time.strftime('%Y-%m-%d %H:%M:%S')
+    return _format_timestamp(int(self._start_epoch + hours * 3600))
 
   def update_calculations(self, *args):
-    """Update charging time calculations and display."""
+    """Sync changed inputs to the charger and update the display."""
+    dirty, self._dirty = self._dirty, set()
+    notices = []
     try:
-      self.charger.battery_capacity = NissanLeafCharger.BATTERY_CAPACITIES[
-        self.battery_var.get()
-      ]
-      self.charger.charging_rate = NissanLeafCharger.CHARGING_RATES[
-        self.charging_var.get()
-      ]
+      if 'battery' in dirty:
+        self.charger.battery_capacity = self._lookup_option(
+          NissanLeafCharger.BATTERY_CAPACITIES,
+          self.battery_var.get(),
+          'battery capacity'
+        )
+      if 'charging' in dirty:
+        self.charger.charging_rate = self._lookup_option(
+          NissanLeafCharger.CHARGING_RATES,
+          self.charging_var.get(),
+          'charging rate'
+        )
+      if 'health' in dirty:
+        self.charger.battery_health = self._read_percentage(
+          self.health_entry, '100', 'Battery health', notices
+        )
+      if 'current' in dirty:
+        self.charger.current_charge = self._read_percentage(
+          self.current_entry, '0', 'Current charge', notices
+        )
+
+      times = self.charger.calculate_charging_times(self.TARGETS)
+
+      # Format every result before touching any widget, then apply the
+      # changes in one pass so Tk redraws the grid once
+      status = '\u26a0 ' + '; '.join(notices) if notices else ''
+      updates = [(self.status_label, status)]
+      for target, hours in times.items():
+        updates.append((self.time_labels[target], self.format_time(hours)))
+        updates.append((
+          self.completion_labels[target], self.calculate_completion_time(hours)
+        ))
+
+    except (ValueError, Exception) as e:
+      # Fields that failed to sync must be retried on the next update
+      self._dirty |= dirty
+      # Clear all result labels on error, reporting bad input inline
+      status = f'\u26a0 {e}' if isinstance(e, ValueError) else ''
+      updates = [(self.status_label, status)]
+      for target in self.TARGETS:
+        updates.append((self.time_labels[target], ''))
+        updates.append((self.completion_labels[target], ''))
+
+    for label, text in updates:
+      self._set_label_text(label, text)
+
+  def _set_entry_text(self, entry, text: str):
+    """Replace the contents of an entry widget.
 
-      self.charger.battery_health = self.validate_number(self.health_var.get())
-      self.charger.current_charge = self.validate_number(self.current_var.get())
-
-      if not (0 <= self.charger.battery_health <= 100):
-        raise ValueError('Battery health must be between 0 and 100')
-      if not (0 <= self.charger.current_charge <= 100):
-        raise ValueError('Current charge must be between 0 and 100')
-
-      time_80 = self.charger.calculate_charging_time(80)
-      time_100 = self.charger.calculate_charging_time(100)
-
-      self.time_80_label.config(text=self.format_time(time_80))
-      self.time_100_label.config(text=self.format_time(time_100))
+    Args:
+      entry: Entry widget to update
+      text: New text for the entry
+    """
+    entry.delete(0, 'end')
+    entry.insert(0, text)
 
-      self.completion_80_label.config(text=self.calculate_completion_time(time_80))
-      self.completion_100_label.config(text=self.calculate_completion_time(time_100))
+  def _set_label_text(self, label, text: str):
+    """Set a label's text, skipping the Tk call if it is unchanged.
 
-    except (ValueError, Exception):
-      # Clear all result labels on error
-      for label in [
-        self.time_80_label,
-        self.time_100_label,
-        self.completion_80_label,
-        self.completion_100_label
-      ]:
-        label.config(text='')
+    Args:
+      label: Label widget to update
+      text: New text for the label
+    """
+    if str(label.cget('text')) != text:
+      label.config(text=text)
 
 
 def main():
   """Main entry point of the application."""
+  # tkinter is imported here rather than at module level so the calculator
+  # can be imported without loading Tcl/Tk
+  import tkinter as tk
+
   root = tk.Tk()
   app = NissanLeafGUI(root)
   root.mainloop()